@@ -373,6 +373,7 @@ class Analyzer:
         max_n_features: int | None = None,
         outer_cv: int | None = None,
         outer_cv_seed: int = 42,
+        n_jobs: int = 1,
     ) -> MLRegressionReport:
         """Conducts a comprehensive regression ML model benchmarking exercise.
         Observations with missing data will be dropped.
@@ -407,6 +408,13 @@ class Analyzer:
         outer_cv_seed : int
             Default: 42. The random seed for the outer cross validation loop.
 
+        n_jobs : int
+            Default: 1. Number of models to fit in parallel. If not 1, the
+            models are fit in separate processes. To fit the models in threads
+            that share the data instead, call this method within
+            joblib.parallel_config(backend="threading"). Either way, each
+            model is fit with a single BLAS/OpenMP thread.
+
         Returns
         -------
         MLRegressionReport
@@ -426,6 +434,7 @@ class Analyzer:
             outer_cv=outer_cv,
             outer_cv_seed=outer_cv_seed,
             verbose=self._verbose,
+            n_jobs=n_jobs,
         )
 
     @ensure_arg_list_uniqueness()
@@ -438,6 +447,7 @@ class Analyzer:
         max_n_features: int | None = None,
         outer_cv: int | None = None,
         outer_cv_seed: int = 42,
+        n_jobs: int = 1,
     ) -> MLClassificationReport:
         """Conducts a comprehensive classification ML model benchmarking exercise.
         Observations with missing data will be dropped.
@@ -475,6 +485,13 @@ class Analyzer:
             Default: 42.
             The random seed for the outer cross validation loop.
 
+        n_jobs : int
+            Default: 1. Number of models to fit in parallel. If not 1, the
+            models are fit in separate processes. To fit the models in threads
+            that share the data instead, call this method within
+            joblib.parallel_config(backend="threading"). Either way, each
+            model is fit with a single BLAS/OpenMP thread.
+
         Returns
         -------
         MLClassificationReport
@@ -494,6 +511,7 @@ class Analyzer:
             outer_cv=outer_cv,
             outer_cv_seed=outer_cv_seed,
             verbose=self._verbose,
+            n_jobs=n_jobs,
         )
 
     # --------------------------------------------------------------------------
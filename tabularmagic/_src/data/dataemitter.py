@@ -134,6 +134,7 @@ class DataEmitter:
         ) = self._compute_categorical_numeric_vars(self._working_df_train)
 
         self._final_X_vars_subset = None
+        self._clear_emission_cache()
 
         self._forward()
 
@@ -171,8 +172,11 @@ class DataEmitter:
         Returns
         -------
         BaseSingleVarScaler | None
-            If the y variable is not scaled, returns None.
+            If the y variable is not scaled, or its scaler is the identity,
+            returns None.
         """
+        if self._yscaler is not None and self._yscaler.is_identity:
+            return None
         return self._yscaler
 
     def emit_train_test_Xy(
@@ -210,42 +214,9 @@ class DataEmitter:
         pd.Series
             y_test_series: The test Series of the target variable.
         """
-        all_vars = self._Xvars + [self._yvar]
-        prev_train_len = len(self._working_df_train)
-        working_df_train = self._working_df_train[all_vars].dropna()
-        new_train_len = len(working_df_train)
-        prev_test_len = len(self._working_df_test)
-        working_df_test = self._working_df_test[all_vars].dropna()
-        new_test_len = len(working_df_test)
-        if prev_train_len != new_train_len:
-            print_wrapped(
-                f"Train data: dropped {prev_train_len - new_train_len} rows "
-                "with missing values "
-                f"out of a total of {prev_train_len} rows.",
-                type="WARNING",
-            )
-        if prev_test_len != new_test_len:
-            print_wrapped(
-                f"Test data: dropped {prev_test_len - new_test_len} rows "
-                "with missing values "
-                f"out of a total of {prev_test_len} rows.",
-                type="WARNING",
-            )
-        X_train_df = self._onehot_helper(
-            working_df_train[self._Xvars], fit=True, use_second_encoder=True
-        )
-        X_test_df = self._onehot_helper(
-            working_df_test[self._Xvars], fit=False, use_second_encoder=True
-        )
-        if self._final_X_vars_subset is not None:
-            X_train_df = X_train_df[self._final_X_vars_subset]
-            X_test_df = X_test_df[self._final_X_vars_subset]
-        return (
-            X_train_df,
-            working_df_train[self._yvar],
-            X_test_df,
-            working_df_test[self._yvar],
-        )
+        X_train_df, y_train_series = self.emit_train_Xy()
+        X_test_df, y_test_series = self.emit_test_Xy()
+        return X_train_df, y_train_series, X_test_df, y_test_series
 
     def emit_train_Xy(self) -> tuple[pd.DataFrame, pd.Series]:
         """Returns a tuple as follows: (X_train_df, y_train_series).
@@ -273,23 +244,28 @@ class DataEmitter:
         pd.Series
             y_train_series: The training Series of the target variable.
         """
-        all_vars = self._Xvars + [self._yvar]
-        prev_train_len = len(self._working_df_train)
-        working_df_train = self._working_df_train[all_vars].dropna()
-        new_train_len = len(working_df_train)
-        if prev_train_len != new_train_len:
-            print_wrapped(
-                f"Train data: dropped {prev_train_len - new_train_len} rows "
-                "with missing values "
-                f"out of a total of {prev_train_len} rows.",
-                type="WARNING",
+        # every model and feature selector fit on this emitter uses the same
+        # train data, so the emitted train data is computed once and shared
+        if self._train_Xy_cache is None:
+            all_vars = self._Xvars + [self._yvar]
+            prev_train_len = len(self._working_df_train)
+            working_df_train = self._working_df_train[all_vars].dropna()
+            new_train_len = len(working_df_train)
+            if prev_train_len != new_train_len:
+                print_wrapped(
+                    f"Train data: dropped {prev_train_len - new_train_len} rows "
+                    "with missing values "
+                    f"out of a total of {prev_train_len} rows.",
+                    type="WARNING",
+                )
+            X_train_df = self._onehot_helper(
+                working_df_train[self._Xvars], fit=True, use_second_encoder=True
             )
-        X_train_df = self._onehot_helper(
-            working_df_train[self._Xvars], fit=True, use_second_encoder=True
-        )
-        if self._final_X_vars_subset is not None:
-            X_train_df = X_train_df[self._final_X_vars_subset]
-        return X_train_df, working_df_train[self._yvar]
+            if self._final_X_vars_subset is not None:
+                X_train_df = X_train_df[self._final_X_vars_subset]
+            self._train_Xy_cache = (X_train_df, working_df_train[self._yvar])
+        X_train_df, y_train_series = self._train_Xy_cache
+        return X_train_df.copy(deep=False), y_train_series.copy(deep=False)
 
     def emit_test_Xy(self) -> tuple[pd.DataFrame, pd.Series]:
         """Returns a tuple as follows: (X_test_df, y_test_series).
@@ -317,22 +293,63 @@ class DataEmitter:
         pd.Series
             y_test_series: The test Series of the target variable.
         """
-        all_vars = self._Xvars + [self._yvar]
-        prev_test_len = len(self._working_df_test)
-        working_df_test = self._working_df_test[all_vars].dropna()
-        new_test_len = len(working_df_test)
-        if prev_test_len != new_test_len:
-            print_wrapped(
-                f"Test data: dropped {prev_test_len - new_test_len} rows "
-                f"with missing values out of a total of {prev_test_len} rows.",
-                type="WARNING",
+        # every model fit on this emitter evaluates on the same test data,
+        # so the emitted test data is computed once and shared
+        if self._test_Xy_cache is None:
+            all_vars = self._Xvars + [self._yvar]
+            prev_test_len = len(self._working_df_test)
+            working_df_test = self._working_df_test[all_vars].dropna()
+            new_test_len = len(working_df_test)
+            if prev_test_len != new_test_len:
+                print_wrapped(
+                    f"Test data: dropped {prev_test_len - new_test_len} rows "
+                    f"with missing values out of a total of {prev_test_len} rows.",
+                    type="WARNING",
+                )
+            X_test_df = self._onehot_helper(
+                working_df_test[self._Xvars], fit=False, use_second_encoder=True
             )
-        X_test_df = self._onehot_helper(
-            working_df_test[self._Xvars], fit=False, use_second_encoder=True
-        )
-        if self._final_X_vars_subset is not None:
-            X_test_df = X_test_df[self._final_X_vars_subset]
-        return X_test_df, working_df_test[self._yvar]
+            if self._final_X_vars_subset is not None:
+                X_test_df = X_test_df[self._final_X_vars_subset]
+            self._test_Xy_cache = (X_test_df, working_df_test[self._yvar])
+        X_test_df, y_test_series = self._test_Xy_cache
+        return X_test_df.copy(deep=False), y_test_series.copy(deep=False)
+
+    def _emit_train_y_unscaled(self) -> np.ndarray:
+        """Returns the train target as a read-only numpy array on its original
+        scale, i.e. inverse transformed if the target was scaled. Computed once
+        and shared by every model fit on this DataEmitter.
+
+        Returns
+        -------
+        np.ndarray ~ (n_train_samples)
+        """
+        if self._train_y_unscaled_cache is None:
+            y_train = self.emit_train_Xy()[1].to_numpy()
+            y_scaler = self.y_scaler()
+            if y_scaler is not None:
+                y_train = y_scaler.inverse_transform(y_train)
+            y_train.flags.writeable = False
+            self._train_y_unscaled_cache = y_train
+        return self._train_y_unscaled_cache
+
+    def _emit_test_y_unscaled(self) -> np.ndarray:
+        """Returns the test target as a read-only numpy array on its original
+        scale, i.e. inverse transformed if the target was scaled. Computed once
+        and shared by every model evaluated on this DataEmitter.
+
+        Returns
+        -------
+        np.ndarray ~ (n_test_samples)
+        """
+        if self._test_y_unscaled_cache is None:
+            y_test = self.emit_test_Xy()[1].to_numpy()
+            y_scaler = self.y_scaler()
+            if y_scaler is not None:
+                y_test = y_scaler.inverse_transform(y_test)
+            y_test.flags.writeable = False
+            self._test_y_unscaled_cache = y_test
+        return self._test_y_unscaled_cache
 
     @ensure_arg_list_uniqueness()
     def select_predictors(self, predictors: list[str] | None):
@@ -344,6 +361,16 @@ class DataEmitter:
             List of predictors to select. If None, all predictors are selected.
         """
         self._final_X_vars_subset = predictors
+        self._clear_emission_cache()
+
+    def _clear_emission_cache(self):
+        """Releases the memoized train and test emissions. They are recomputed
+        on the next emit call.
+        """
+        self._train_Xy_cache = None
+        self._test_Xy_cache = None
+        self._train_y_unscaled_cache = None
+        self._test_y_unscaled_cache = None
 
     def _onehot(
         self,
@@ -1090,6 +1117,7 @@ class DataEmitter:
         new_emitter = self.copy()
         del new_emitter._working_df_train
         del new_emitter._working_df_test
+        new_emitter._clear_emission_cache()
 
         custom_transformer = FunctionTransformer(
             new_emitter.custom_transform, validate=False, check_inverse=False
@@ -35,6 +35,12 @@ class BaseSingleVarScaler:
         """Inverse transforms x_scaled. Robust to missing values in x_scaled."""
         pass
 
+    @property
+    def is_identity(self) -> bool:
+        """True if the fitted transform leaves values unchanged, in which
+        case callers may skip transform and inverse_transform."""
+        return False
+
 
 class MinMaxSingleVar(BaseSingleVarScaler):
     """Min max scaling of a single variable"""
@@ -52,7 +58,14 @@ class MinMaxSingleVar(BaseSingleVarScaler):
 
     def inverse_transform(self, x_scaled: np.ndarray):
         """Inverse transforms x_scaled. Robust to missing values in x_scaled."""
-        return (self.max - self.min) * x_scaled + self.min
+        # the offset is added in place to avoid a second temporary array
+        x = (self.max - self.min) * x_scaled
+        x += self.min
+        return x
+
+    @property
+    def is_identity(self) -> bool:
+        return bool(self.min == 0 and self.max == 1)
 
 
 class StandardizeSingleVar(BaseSingleVarScaler):
@@ -71,7 +84,14 @@ class StandardizeSingleVar(BaseSingleVarScaler):
 
     def inverse_transform(self, x_scaled: np.ndarray):
         """Inverse transforms x_scaled. Robust to missing values in x_scaled."""
-        return self.sigma * x_scaled + self.mu
+        # the offset is added in place to avoid a second temporary array
+        x = self.sigma * x_scaled
+        x += self.mu
+        return x
+
+    @property
+    def is_identity(self) -> bool:
+        return bool(self.mu == 0 and self.sigma == 1)
 
 
 class LogTransformSingleVar(BaseSingleVarScaler):
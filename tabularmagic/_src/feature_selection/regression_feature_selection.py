@@ -1,17 +1,295 @@
 import numpy as np
-from sklearn.feature_selection import (
-    SelectKBest,
-    f_regression,
-    mutual_info_regression,
-    r_regression,
-    SelectFromModel,
-)
+from functools import partial
+from joblib import Parallel, delayed
+from scipy.special import digamma
+from sklearn.feature_selection import SelectFromModel
 from sklearn.linear_model import Lasso, LassoCV
+from sklearn.neighbors import KDTree, NearestNeighbors
+from sklearn.preprocessing import scale
 from typing import Literal
+from ._kernels import lasso_cd_kernel, numba_available
 from .base_feature_selection import BaseFSR
 from ..data.datahandler import DataEmitter
 
 
+def _f_regression_fast(
+    X: np.ndarray, y: np.ndarray, return_r: bool = False
+) -> np.ndarray:
+    """Computes the univariate linear regression F-statistic (or the Pearson
+    correlation) of each predictor with the target, using a single matrix-vector
+    product for all predictors. Matches sklearn's f_regression and r_regression
+    with force_finite=True.
+
+    Parameters
+    ----------
+    X : np.ndarray ~ (n_samples, n_features)
+
+    y : np.ndarray ~ (n_samples)
+
+    return_r : bool
+        Default: False. If True, returns the Pearson correlations instead of
+        the F-statistics.
+
+    Returns
+    -------
+    np.ndarray ~ (n_features)
+    """
+    n = X.shape[0]
+    # X need not be centered since the centered y sums to zero; the operations
+    # follow sklearn's order so that the scores agree to rounding
+    yc = y - y.mean()
+    X_means = X.mean(axis=0)
+    X_norms = np.sqrt(np.einsum("ij,ij->j", X, X) - n * X_means**2)
+    r = yc @ X
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r /= X_norms
+        r /= np.linalg.norm(yc)
+    # constant features or target
+    r[np.isnan(r)] = 0.0
+    if return_r:
+        return r
+    r_squared = r**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f = r_squared / (1 - r_squared) * (n - 2)
+    # perfect (anti-)correlation
+    f[np.isinf(f)] = np.finfo(f.dtype).max
+    f[np.isnan(f)] = 0.0
+    return f
+
+
+def _mi_feature_counts(
+    x: np.ndarray, y: np.ndarray, y_tree: KDTree, n_neighbors: int
+) -> float:
+    """Returns the mean digamma neighbor-count terms of the Kraskov mutual
+    information estimate for a single continuous feature, querying the
+    target's marginal KD-tree rather than rebuilding it.
+
+    Parameters
+    ----------
+    x : np.ndarray ~ (n_samples, 1)
+
+    y : np.ndarray ~ (n_samples, 1)
+
+    y_tree : KDTree
+        Chebyshev KD-tree fit on y.
+
+    n_neighbors : int
+
+    Returns
+    -------
+    float
+    """
+    nn = NearestNeighbors(metric="chebyshev", n_neighbors=n_neighbors)
+    nn.fit(np.hstack((x, y)))
+    radius = np.nextafter(nn.kneighbors()[0][:, -1], 0)
+    nx = KDTree(x, metric="chebyshev").query_radius(
+        x, radius, count_only=True, return_distance=False
+    )
+    ny = y_tree.query_radius(y, radius, count_only=True, return_distance=False)
+    return np.mean(digamma(nx)) + np.mean(digamma(ny))
+
+
+def _mutual_info_regression_fast(
+    X: np.ndarray,
+    y: np.ndarray,
+    n_neighbors: int = 3,
+    random_state: int = 42,
+    n_jobs: int = -1,
+) -> np.ndarray:
+    """Estimates the mutual information between each continuous predictor and
+    a continuous target. Matches sklearn's mutual_info_regression for dense
+    inputs, but fits the target's KD-tree once and shares it across all
+    predictors.
+
+    Parameters
+    ----------
+    X : np.ndarray ~ (n_samples, n_features)
+
+    y : np.ndarray ~ (n_samples)
+
+    n_neighbors : int
+        Default: 3.
+
+    random_state : int
+        Default: 42. Seeds the small noise added to the data.
+
+    n_jobs : int
+        Default: -1. Number of threads across predictors.
+
+    Returns
+    -------
+    np.ndarray ~ (n_features)
+    """
+    n_samples, n_features = X.shape
+    rng = np.random.RandomState(random_state)
+    # same scaling and noise, drawn in the same order, as sklearn
+    X = scale(X, with_mean=False)
+    means = np.maximum(1, np.mean(np.abs(X), axis=0))
+    X += 1e-10 * means * rng.standard_normal(size=(n_samples, n_features))
+    y = scale(y, with_mean=False)
+    y += 1e-10 * np.maximum(1, np.mean(np.abs(y))) * rng.standard_normal(size=n_samples)
+    y = y.reshape(-1, 1)
+    y_tree = KDTree(y, metric="chebyshev")
+    counts = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_mi_feature_counts)(X[:, [j]], y, y_tree, n_neighbors)
+        for j in range(n_features)
+    )
+    mi = digamma(n_samples) + digamma(n_neighbors) - np.array(counts)
+    return np.maximum(mi, 0)
+
+
+def _top_k_support(scores: np.ndarray, k: int) -> np.ndarray:
+    """Returns the boolean support mask of the k highest scores. Ties are broken
+    the same way as sklearn's SelectKBest. Uses a linear-time partition rather
+    than a full sort of the scores.
+
+    Parameters
+    ----------
+    scores : np.ndarray ~ (n_features)
+
+    k : int
+
+    Returns
+    -------
+    np.ndarray ~ (n_features)
+    """
+    n = len(scores)
+    if k >= n:
+        return np.ones(n, dtype=bool)
+    if k <= 0:
+        return np.zeros(n, dtype=bool)
+    threshold = scores[np.argpartition(scores, -k)[-k:]].min()
+    support = scores > threshold
+    # SelectKBest keeps the last k of a stable ascending sort, so among scores
+    # tied at the threshold the highest indices are kept
+    n_ties = k - np.count_nonzero(support)
+    support[np.flatnonzero(scores == threshold)[-n_ties:]] = True
+    return support
+
+
+def _lasso_fista(
+    X: np.ndarray,
+    y: np.ndarray,
+    alpha: float,
+    max_iter: int = 1000,
+    tol: float = 1e-4,
+) -> tuple[np.ndarray, float]:
+    """Solves the Lasso problem with intercept,
+    (1 / (2 * n)) * ||y - Xw - b||^2_2 + alpha * ||w||_1,
+    via FISTA (accelerated proximal gradient descent).
+
+    Parameters
+    ----------
+    X : np.ndarray ~ (n_samples, n_features)
+
+    y : np.ndarray ~ (n_samples)
+
+    alpha : float
+        Regularization term weight.
+
+    max_iter : int
+        Default: 1000. Maximum number of iterations.
+
+    tol : float
+        Default: 1e-4. Iteration stops once the relative change in the
+        coefficients falls below tol.
+
+    Returns
+    -------
+    np.ndarray ~ (n_features)
+        Coefficients.
+
+    float
+        Intercept.
+    """
+    n, p = X.shape
+    X_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    Xc = X - X_mean
+    yc = y - y_mean
+
+    # Lipschitz constant of the gradient, ||Xc||_2^2 / n, via power iteration
+    v = np.random.default_rng(42).standard_normal(p).astype(X.dtype)
+    v /= np.linalg.norm(v)
+    lipschitz = 0.0
+    for _ in range(100):
+        w = Xc.T @ (Xc @ v)
+        w_norm = np.linalg.norm(w)
+        if w_norm == 0.0:
+            break
+        v = w / w_norm
+        converged = abs(w_norm - lipschitz) <= 1e-6 * w_norm
+        lipschitz = w_norm
+        if converged:
+            break
+    # slight inflation guards against the power iteration underestimate
+    lipschitz = 1.01 * lipschitz / n
+
+    # iterates share the dtype of X so that the products do not upcast X
+    coef = np.zeros(p, dtype=X.dtype)
+    if lipschitz == 0.0:
+        return coef, y_mean
+
+    z = coef
+    t = 1.0
+    threshold = alpha / lipschitz
+    for _ in range(max_iter):
+        u = z - (Xc.T @ (Xc @ z - yc)) / (n * lipschitz)
+        coef_next = np.sign(u) * np.maximum(np.abs(u) - threshold, 0.0)
+        t_next = (1.0 + (1.0 + 4.0 * t * t) ** 0.5) / 2.0
+        z = coef_next + ((t - 1.0) / t_next) * (coef_next - coef)
+        delta = np.linalg.norm(coef_next - coef)
+        coef = coef_next
+        t = t_next
+        if delta <= tol * max(np.linalg.norm(coef), np.finfo(np.float64).eps):
+            break
+
+    return coef, y_mean - X_mean @ coef
+
+
+def _lasso_cd(
+    X: np.ndarray,
+    y: np.ndarray,
+    alpha: float,
+    max_iter: int = 1000,
+    tol: float = 1e-4,
+) -> tuple[np.ndarray, float]:
+    """Solves the Lasso problem with intercept,
+    (1 / (2 * n)) * ||y - Xw - b||^2_2 + alpha * ||w||_1,
+    via the numba-compiled coordinate descent kernel.
+
+    Parameters
+    ----------
+    X : np.ndarray ~ (n_samples, n_features)
+
+    y : np.ndarray ~ (n_samples)
+
+    alpha : float
+        Regularization term weight.
+
+    max_iter : int
+        Default: 1000. Maximum number of passes over the features.
+
+    tol : float
+        Default: 1e-4. Iteration stops once the largest coefficient update
+        is below tol times the largest coefficient.
+
+    Returns
+    -------
+    np.ndarray ~ (n_features)
+        Coefficients.
+
+    float
+        Intercept.
+    """
+    X_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    coef = lasso_cd_kernel(
+        np.asfortranarray(X - X_mean), y - y_mean, alpha * X.shape[0], max_iter, tol
+    )
+    return coef, y_mean - X_mean @ coef
+
+
 class KBestFSR(BaseFSR):
     """Selects the k best features based on the f_regression, r_regression,
     or mutual info regression score.
@@ -22,6 +300,7 @@ class KBestFSR(BaseFSR):
         scorer: Literal["f_regression", "r_regression", "mutual_info_regression"],
         k: int,
         name: str | None = None,
+        n_jobs: int = -1,
     ):
         """
         Constructs a KBestFSR.
@@ -36,12 +315,26 @@ class KBestFSR(BaseFSR):
 
         name : str | None
             Default: None. If None, then outputs the class name.
+
+        n_jobs : int
+            Default: -1. Number of parallel jobs used to compute the
+            mutual information scores. Only used if scorer is
+            'mutual_info_regression'. -1 uses all processors.
         """
         if name is None:
             name = f"KBestFSR({scorer})"
         super().__init__(name)
         self._scorer = scorer
         self._k = k
+        self._n_jobs = n_jobs
+        if scorer == "f_regression":
+            self._scorer_fn = _f_regression_fast
+        elif scorer == "r_regression":
+            self._scorer_fn = partial(_f_regression_fast, return_r=True)
+        elif scorer == "mutual_info_regression":
+            self._scorer_fn = partial(_mutual_info_regression_fast, n_jobs=n_jobs)
+        else:
+            raise ValueError(f"Invalid value for scorer: {scorer}.")
 
     def select(
         self, dataemitter: DataEmitter
@@ -65,23 +358,16 @@ class KBestFSR(BaseFSR):
         np.ndarray ~ (n_in_features)
             Boolean mask, the support for selected features.
         """
-        scorer = None
-        if self._scorer == "f_regression":
-            scorer = f_regression
-        elif self._scorer == "mutual_info_regression":
-            scorer = mutual_info_regression
-        elif self._scorer == "r_regression":
-            scorer = r_regression
-        selector = SelectKBest(scorer, k=self._k)
-
         X_train, y_train = dataemitter.emit_train_Xy()
         self._all_features = X_train.columns.to_numpy()
-        selector.fit(X=X_train, y=y_train)
 
-        self._selected_features = selector.get_feature_names_out()
-        self._all_feature_scores = selector.scores_
-        self._support = selector.get_support()
-        self._selected_feature_scores = selector.scores_[self._support]
+        scores = self._scorer_fn(
+            X_train.to_numpy(dtype=np.float64), y_train.to_numpy(dtype=np.float64)
+        )
+        self._all_feature_scores = scores
+        self._support = _top_k_support(scores, self._k)
+        self._selected_features = self._all_features[self._support]
+        self._selected_feature_scores = scores[self._support]
         return self._all_features, self._selected_features, self._support
 
 
@@ -95,6 +381,8 @@ class LassoFSR(BaseFSR):
         max_n_features: int,
         alpha: float | None = None,
         name: str | None = None,
+        solver: Literal["cd", "fista"] = "cd",
+        single_precision: bool = False,
     ):
         """
         Constructs a LassoFSR.
@@ -111,14 +399,37 @@ class LassoFSR(BaseFSR):
 
         name : str | None
             Default: None. If None, then name is set to default.
+
+        solver : Literal['cd', 'fista']
+            Default: 'cd'. The Lasso solver. 'cd' uses sklearn's coordinate
+            descent. 'fista' uses accelerated proximal gradient descent, which
+            can be faster for dense data with a moderate number of predictors.
+            'fista' requires alpha to be specified. If solver is 'cd', alpha is
+            specified, and numba is installed, a numba-compiled coordinate
+            descent with sklearn's update order and duality gap stopping rule
+            is used in place of sklearn's.
+
+        single_precision : bool
+            Default: False. If True, the Lasso is fit in float32, which halves
+            memory traffic on wide data. The selected features are unchanged up
+            to coefficients near the selection threshold.
         """
         if name is None:
             name = "LassoFSR"
         super().__init__(name)
+        if solver not in ["cd", "fista"]:
+            raise ValueError(f"Invalid value for solver: {solver}.")
+        if solver == "fista" and alpha is None:
+            raise ValueError("alpha must be specified if solver is 'fista'.")
+        self._solver = solver
+        self._alpha = alpha
+        self._single_precision = single_precision
+        # select() hands sklearn a private copy of X, which it may center
+        # in place rather than copy again
         if alpha is None:
-            self._model = LassoCV(cv=5)
+            self._model = LassoCV(cv=5, copy_X=False)
         else:
-            self._model = Lasso(alpha=alpha)
+            self._model = Lasso(alpha=alpha, copy_X=False)
         self._max_n_features = max_n_features
 
     def select(
@@ -146,13 +457,35 @@ class LassoFSR(BaseFSR):
         X_train, y_train = dataemitter.emit_train_Xy()
         self._all_features = X_train.columns.to_numpy()
 
-        self._model.fit(X=X_train.to_numpy(), y=y_train.to_numpy())
+        dtype = np.float32 if self._single_precision else np.float64
+        yn = np.ascontiguousarray(y_train.to_numpy(dtype=dtype))
+        if self._solver == "fista":
+            solve = _lasso_fista
+        elif self._alpha is not None and numba_available:
+            solve = _lasso_cd
+        else:
+            solve = None
+
+        if solve is None:
+            # to_numpy may return a view of the emitted data, so X is copied
+            # column by column into a private Fortran-ordered array, the
+            # layout sklearn's coordinate descent requires
+            Xn = np.empty(X_train.shape, dtype=dtype, order="F")
+            for j, (_, column) in enumerate(X_train.items()):
+                Xn[:, j] = column.to_numpy()
+            self._model.fit(X=Xn, y=yn)
+        else:
+            Xn = X_train.to_numpy(dtype=dtype)
+            self._model.coef_, self._model.intercept_ = solve(
+                Xn, yn, self._model.alpha, self._model.max_iter, self._model.tol
+            )
+            self._model.n_features_in_ = Xn.shape[1]
+        # the model is already fit; SelectFromModel only thresholds its coef_
         selector = SelectFromModel(
             estimator=self._model, prefit=True, max_features=self._max_n_features
         )
-        selector.fit(X=X_train, y=y_train)
 
-        self._selected_features = selector.get_feature_names_out()
         self._support = selector.get_support()
-        self._all_feature_scores = selector.estimator_.coef_
+        self._selected_features = self._all_features[self._support]
+        self._all_feature_scores = self._model.coef_
         return self._all_features, self._selected_features, self._support
@@ -1,15 +1,97 @@
 import numpy as np
 import pandas as pd
-from sklearn.metrics import (
-    root_mean_squared_error,
-    mean_absolute_error,
-    mean_absolute_percentage_error,
-    r2_score,
-)
-from scipy.stats import pearsonr, spearmanr
+import warnings
+from scipy.stats import rankdata
 from ..._src.display.print_utils import print_wrapped
 
 
+STATISTIC_NAMES = [
+    "rmse",
+    "mae",
+    "mape",
+    "pearsonr",
+    "spearmanr",
+    "r2",
+    "adjr2",
+    "n_obs",
+]
+
+
+def _pearsonr(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two 1D arrays, computed as scipy's pearsonr does.
+    Returns NaN if either array is constant.
+    """
+    xm = x - x.mean()
+    ym = y - y.mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.dot(xm / np.linalg.norm(xm), ym / np.linalg.norm(ym))
+    return float(np.clip(r, -1.0, 1.0))
+
+
+def _regression_statistics(
+    y_true: np.ndarray, y_pred: np.ndarray, n_predictors: int | None
+) -> np.ndarray:
+    """Computes all regression statistics from a single residual vector,
+    rather than through one sklearn/scipy metric call (and input validation
+    pass) per statistic. Matches sklearn's root_mean_squared_error,
+    mean_absolute_error, mean_absolute_percentage_error and r2_score, and
+    scipy's pearsonr and spearmanr.
+
+    Parameters
+    ----------
+    y_true : np.ndarray ~ (sample_size)
+
+    y_pred : np.ndarray ~ (sample_size)
+
+    n_predictors : int | None
+        If None, the adjusted R squared is NaN.
+
+    Returns
+    -------
+    np.ndarray ~ (len(STATISTIC_NAMES))
+        The statistics, ordered as in STATISTIC_NAMES.
+    """
+    y_true = np.asarray(y_true, dtype=np.float64).ravel()
+    y_pred = np.asarray(y_pred, dtype=np.float64).ravel()
+    n = len(y_true)
+
+    resid = y_pred - y_true
+    abs_resid = np.abs(resid)
+    ss_res = float(np.dot(resid, resid))
+    y_true_centered = y_true - y_true.mean()
+    ss_tot = float(np.dot(y_true_centered, y_true_centered))
+    if ss_tot != 0.0:
+        r2 = 1.0 - ss_res / ss_tot
+    else:
+        r2 = 1.0 if ss_res == 0.0 else 0.0
+
+    if n_predictors is None:
+        adjr2 = np.nan
+    else:
+        try:
+            adjr2 = 1 - (((1 - r2) * (n - 1)) / (n - n_predictors - 1))
+        except ZeroDivisionError:
+            adjr2 = np.nan
+            print_wrapped(
+                "ZeroDivisionError occurred during calculation of "
+                "adjusted R squared. Setting adjusted R squared to NaN.",
+                type="WARNING",
+            )
+
+    return np.array(
+        [
+            np.sqrt(ss_res / n),
+            abs_resid.mean(),
+            np.mean(abs_resid / np.maximum(np.abs(y_true), np.finfo(np.float64).eps)),
+            _pearsonr(y_true, y_pred),
+            _pearsonr(rankdata(y_true), rankdata(y_pred)),
+            r2,
+            adjr2,
+            n,
+        ]
+    )
+
+
 class RegressionScorer:
     """Class for scoring of regression fits.
     Only inputs are predicted and true values.
@@ -65,116 +147,37 @@ class RegressionScorer:
         y_pred = self._y_pred
         y_true = self._y_true
 
+        # statistics are gathered into arrays and each DataFrame is built once
         if isinstance(y_pred, np.ndarray) and isinstance(y_true, np.ndarray):
-            n = len(y_pred)
-            df = pd.DataFrame(columns=[self._name])
-            df.loc["rmse", self._name] = root_mean_squared_error(y_true, y_pred)
-            df.loc["mae", self._name] = mean_absolute_error(y_true, y_pred)
-            df.loc["mape", self._name] = mean_absolute_percentage_error(y_true, y_pred)
-            df.loc["pearsonr", self._name] = pearsonr(y_true, y_pred)[0]
-            df.loc["spearmanr", self._name] = spearmanr(y_true, y_pred)[0]
-            df.loc["r2", self._name] = r2_score(y_true, y_pred)
-            if self._n_predictors is None:
-                df.loc["adjr2", self._name] = np.NaN
-            else:
-                try:
-                    adjr2 = 1 - (
-                        ((1 - df.loc["r2", self._name]) * (n - 1))
-                        / (n - self._n_predictors - 1)
-                    )
-                except ZeroDivisionError:
-                    adjr2 = np.NaN
-                    print_wrapped(
-                        "ZeroDivisionError occurred during calculation of "
-                        "adjusted R squared. Setting adjusted R squared to NaN.",
-                        type="WARNING",
-                    )
-            df.loc["n_obs", self._name] = len(y_true)
-            df = df.rename_axis("Statistic", axis="rows")
-            self._stats_df = df
+            stats = _regression_statistics(y_true, y_pred, self._n_predictors)
+            self._stats_df = pd.DataFrame(
+                stats.reshape(-1, 1),
+                index=pd.Index(STATISTIC_NAMES, name="Statistic"),
+                columns=[self._name],
+            )
         elif isinstance(y_pred, list) and isinstance(y_true, list):
             assert len(y_pred) == len(y_true)
-            cvdf = pd.DataFrame(columns=["Fold", "Statistic", self._name])
-            for i, (y_pred_elem, y_true_elem) in enumerate(zip(y_pred, y_true)):
-                n = len(y_pred_elem)
-                cvdf.loc[len(cvdf)] = pd.Series(
-                    {
-                        "Statistic": "rmse",
-                        self._name: root_mean_squared_error(y_true_elem, y_pred_elem),
-                        "Fold": i,
-                    }
-                )
-                cvdf.loc[len(cvdf)] = pd.Series(
-                    {
-                        "Statistic": "mae",
-                        self._name: mean_absolute_error(y_true_elem, y_pred_elem),
-                        "Fold": i,
-                    }
-                )
-                cvdf.loc[len(cvdf)] = pd.Series(
-                    {
-                        "Statistic": "mape",
-                        self._name: mean_absolute_percentage_error(
-                            y_true_elem, y_pred_elem
-                        ),
-                        "Fold": i,
-                    }
-                )
-                cvdf.loc[len(cvdf)] = pd.Series(
-                    {
-                        "Statistic": "pearsonr",
-                        self._name: pearsonr(y_true_elem, y_pred_elem)[0],
-                        "Fold": i,
-                    }
-                )
-                cvdf.loc[len(cvdf)] = pd.Series(
-                    {
-                        "Statistic": "spearmanr",
-                        self._name: spearmanr(y_true_elem, y_pred_elem)[0],
-                        "Fold": i,
-                    }
-                )
-                r2 = r2_score(y_true_elem, y_pred_elem)
-                cvdf.loc[len(cvdf)] = pd.Series(
-                    {"Statistic": "r2", self._name: r2, "Fold": i}
-                )
-                if self._n_predictors is None:
-                    adjr2 = np.NaN
-                else:
-                    try:
-                        adjr2 = 1 - (
-                            ((1 - r2) * (n - 1)) / (n - self._n_predictors - 1)
-                        )
-                    except ZeroDivisionError:
-                        adjr2 = np.NaN
-                        print_wrapped(
-                            "ZeroDivisionError occurred during calculation of "
-                            "adjusted R squared. Setting adjusted R squared to NaN.",
-                            type="WARNING",
-                        )
-
-                cvdf.loc[len(cvdf)] = pd.Series(
-                    {"Statistic": "adjr2", self._name: adjr2, "Fold": i}
-                )
-                cvdf.loc[len(cvdf)] = pd.Series(
-                    {"Statistic": "n_obs", self._name: n, "Fold": i}
-                )
-            self._cv_stats_df = cvdf.set_index(["Fold", "Statistic"])
-            self._stats_df = (
-                cvdf.groupby(["Statistic"])[[self._name]]
-                .mean()
-                .reindex(
-                    [
-                        "rmse",
-                        "mae",
-                        "mape",
-                        "pearsonr",
-                        "spearmanr",
-                        "r2",
-                        "adjr2",
-                        "n_obs",
-                    ]
-                )
+            fold_stats = np.array(
+                [
+                    _regression_statistics(y_true_elem, y_pred_elem, self._n_predictors)
+                    for y_pred_elem, y_true_elem in zip(y_pred, y_true)
+                ]
+            ).reshape(len(y_pred), len(STATISTIC_NAMES))
+            self._cv_stats_df = pd.DataFrame(
+                fold_stats.reshape(-1, 1),
+                index=pd.MultiIndex.from_product(
+                    [range(len(y_pred)), STATISTIC_NAMES], names=["Fold", "Statistic"]
+                ),
+                columns=[self._name],
+            )
+            # like a groupby mean, folds with undefined statistics are skipped
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                mean_stats = np.nanmean(fold_stats, axis=0)
+            self._stats_df = pd.DataFrame(
+                mean_stats.reshape(-1, 1),
+                index=pd.Index(STATISTIC_NAMES, name="Statistic"),
+                columns=[self._name],
             )
 
         else:
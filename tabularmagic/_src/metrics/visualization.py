@@ -15,6 +15,8 @@ def plot_obs_vs_pred(
     model_name: str | None = None,
     figsize: tuple[float, float] = (5, 5),
     ax: plt.Axes | None = None,
+    limits: tuple[float, float] | None = None,
+    rho: float | None = None,
 ) -> plt.Figure:
     """Returns a figure that is a scatter plot of the observed and predicted y
     values. Predicted values on x axis, observed values on y axis.
@@ -37,6 +39,14 @@ def plot_obs_vs_pred(
     ax : plt.Axes | None
         Default: None. The axes to plot on. If None, a new figure is created.
 
+    limits : tuple[float, float] | None
+        Default: None. The (min, max) limits of both axes. If None, the limits
+        are computed from y_pred and y_true.
+
+    rho : float | None
+        Default: None. The Pearson correlation shown in the title. If None,
+        it is computed from y_pred and y_true.
+
     Returns
     -------
     plt.Figure
@@ -46,8 +56,11 @@ def plot_obs_vs_pred(
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=figsize)
 
-    min_val = np.min(np.hstack((y_pred, y_true)))
-    max_val = np.max(np.hstack((y_pred, y_true)))
+    if limits is None:
+        min_val = min(np.min(y_pred), np.min(y_true))
+        max_val = max(np.max(y_pred), np.max(y_true))
+    else:
+        min_val, max_val = limits
     ax.plot(
         [min_val, max_val],
         [min_val, max_val],
@@ -56,22 +69,27 @@ def plot_obs_vs_pred(
         linewidth=plot_options._line_width,
     )
 
-    ax.scatter(y_pred, y_true, s=plot_options._dot_size, color=plot_options._dot_color)
+    # large scatters are drawn as a single image, which keeps redraws and
+    # vector (pdf/svg) exports fast and small
+    ax.scatter(
+        y_pred,
+        y_true,
+        s=plot_options._dot_size,
+        color=plot_options._dot_color,
+        rasterized=len(y_true) > 10_000,
+    )
 
     ax.set_xlim(min_val, max_val)
     ax.set_ylim(min_val, max_val)
     ax.set_xlabel("Predicted")
     ax.set_ylabel("Observed")
 
+    if rho is None:
+        rho = pearsonr(y_pred, y_true)[0]
     if model_name is not None:
-        ax.set_title(
-            f"{model_name}: Observed vs Predicted | "
-            f"ρ = {round(pearsonr(y_pred, y_true)[0], 3)}"
-        )
+        ax.set_title(f"{model_name}: Observed vs Predicted | ρ = {round(rho, 3)}")
     else:
-        ax.set_title(
-            "Observed vs Predicted | " + f"ρ = {round(pearsonr(y_pred, y_true)[0], 3)}"
-        )
+        ax.set_title("Observed vs Predicted | " + f"ρ = {round(rho, 3)}")
     ax.ticklabel_format(style="sci", axis="both", scilimits=plot_options._scilimits)
     ax.yaxis.get_offset_text().set_fontsize(ax.yaxis.get_ticklabels()[0].get_fontsize())
     ax.xaxis.get_offset_text().set_fontsize(ax.xaxis.get_ticklabels()[0].get_fontsize())
@@ -101,6 +119,7 @@ def plot_roc_curve(
     y_true: np.ndarray,
     model_name: str | None = None,
     label_curve: bool = False,
+    color: str | Any | None = None,
     figsize: tuple[float, float] = (5, 5),
     ax: plt.Axes | None = None,
 ) -> plt.Figure:
@@ -121,6 +140,10 @@ def plot_roc_curve(
     label_curve : bool
         Default: False. Whether to label the ROC curve with model name and AUC.
 
+    color : str | Any | None
+        Default: None. The color of the ROC curve. If None, the line color
+        from plot_options is used.
+
     figsize : tuple[float, float]
         Default: (5, 5). The size of the figure. Only used if ax is None.
 
@@ -136,6 +159,9 @@ def plot_roc_curve(
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=figsize)
 
+    if color is None:
+        color = plot_options._line_color
+
     fpr, tpr, _ = roc_curve(y_true, y_score)
     roc_auc = auc(fpr, tpr)
 
@@ -151,15 +177,13 @@ def plot_roc_curve(
             ax.plot(
                 fpr,
                 tpr,
-                color=plot_options._line_color,
+                color=color,
                 label=f"{model_name} | AUC = {roc_auc:.3f}",
             )
         else:
-            ax.plot(
-                fpr, tpr, color=plot_options._line_color, label=f"AUC = {roc_auc:.3f}"
-            )
+            ax.plot(fpr, tpr, color=color, label=f"AUC = {roc_auc:.3f}")
     else:
-        ax.plot(fpr, tpr, color=plot_options._line_color)
+        ax.plot(fpr, tpr, color=color)
     ax.set_xlim([-0.05, 1.05])
     ax.set_ylim([-0.05, 1.05])
     ax.set_xlabel("False Positive Rate")
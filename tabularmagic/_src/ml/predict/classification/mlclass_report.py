@@ -1,11 +1,18 @@
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 from typing import Literal, Any
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+from ..predict_utils import (
+    fit_model,
+    fit_models,
+    concat_stats_columns,
+    summarize_fitted_models,
+)
 from .base import BaseC
-from ....metrics.classification_scoring import ClassificationBinaryScorer
 from ....data.datahandler import DataHandler
 from ....metrics.visualization import plot_roc_curve, plot_confusion_matrix
 from ....display.print_utils import (
@@ -45,7 +52,7 @@ class SingleModelSingleDatasetMLClassReport:
             The dataset to generate the report for.
         """
         self._model = model
-        self._is_binary = isinstance(model._train_scorer, ClassificationBinaryScorer)
+        self._is_binary = model.is_binary()
         if dataset not in ["train", "test"]:
             raise ValueError('dataset must be either "train" or "test".')
         self._dataset = dataset
@@ -264,6 +271,8 @@ class SingleModelMLClassReport:
             specified data.
         """
         self._model = model
+        self._train_report = SingleModelSingleDatasetMLClassReport(model, "train")
+        self._test_report = SingleModelSingleDatasetMLClassReport(model, "test")
 
     def train_report(self) -> SingleModelSingleDatasetMLClassReport:
         """Returns a SingleModelSingleDatasetMLClassReport
@@ -273,7 +282,7 @@ class SingleModelMLClassReport:
         -------
         SingleModelSingleDatasetMLClassReport
         """
-        return SingleModelSingleDatasetMLClassReport(self._model, "train")
+        return self._train_report
 
     def test_report(self) -> SingleModelSingleDatasetMLClassReport:
         """Returns a SingleModelSingleDatasetMLClassReport
@@ -283,7 +292,7 @@ class SingleModelMLClassReport:
         -------
         SingleModelSingleDatasetMLClassReport
         """
-        return SingleModelSingleDatasetMLClassReport(self._model, "test")
+        return self._test_report
 
     def plot_confusion_matrix(
         self,
@@ -397,6 +406,7 @@ class MLClassificationReport:
         outer_cv: int | None = None,
         outer_cv_seed: int = 42,
         verbose: bool = True,
+        n_jobs: int = 1,
     ):
         """MLClassificationReport.
         Fits the model based on provided DataHandler.
@@ -435,18 +445,24 @@ class MLClassificationReport:
 
         verbose: bool
             Default: True. If True, prints updates on model fitting.
+
+        n_jobs: int
+            Default: 1. Number of models to fit in parallel. If not 1, the
+            models are fit in separate processes, and the fitted models
+            replace the provided model objects. To fit the models in threads
+            that share the data instead, wrap the call in
+            joblib.parallel_config(backend="threading"). Either way, each
+            model is fit with a single BLAS/OpenMP thread.
         """
-        self._models: list[BaseC] = models
+        self._models: list[BaseC] = list(models)
 
+        self._id_to_model = {}
         for model in self._models:
             if not isinstance(model, BaseC):
                 raise ValueError(
                     f"Model {model} is not an instance of BaseC. "
                     "All models must be instances of BaseC."
                 )
-
-        self._id_to_model = {}
-        for model in models:
             if model._name in self._id_to_model:
                 raise ValueError(f"Duplicate model name: {model._name}.")
             self._id_to_model[model._name] = model
@@ -497,13 +513,26 @@ class MLClassificationReport:
                     emitter.select_predictors(fold_selection_report.top_features())
 
         self._verbose = verbose
-        for model in self._models:
+        if n_jobs != 1:
             if self._verbose:
                 print_wrapped(
-                    f"Evaluating model {quote_and_color(model._name)}.", type="UPDATE"
+                    f"Evaluating {len(self._models)} models in parallel.",
+                    type="UPDATE",
                 )
-            model.specify_data(dataemitter=self._emitter, dataemitters=self._emitters)
-            model.fit(verbose=self._verbose)
+            self._models = fit_models(
+                self._models, self._emitter, self._emitters, n_jobs
+            )
+
+        self._id_to_report = {}
+        self._reports: list[SingleModelMLClassReport] = []
+        for model in self._models:
+            if n_jobs == 1:
+                if self._verbose:
+                    print_wrapped(
+                        f"Evaluating model {quote_and_color(model._name)}.",
+                        type="UPDATE",
+                    )
+                fit_model(model, self._emitter, self._emitters, self._verbose)
 
             if (
                 model._feature_selection_report is not None
@@ -536,9 +565,21 @@ class MLClassificationReport:
                     type="UPDATE",
                 )
 
-        self._id_to_report = {
-            model._name: SingleModelMLClassReport(model) for model in models
-        }
+            # parallel fitting returns new model objects; both lookups are
+            # (re)filled here in the same pass
+            self._id_to_model[model._name] = model
+            report = SingleModelMLClassReport(model)
+            self._id_to_report[model._name] = report
+            self._reports.append(report)
+
+        (
+            self._train_stats_all,
+            self._test_stats_all,
+            self._cv_models,
+            self._cv_stats_all,
+        ) = summarize_fitted_models(self._models)
+        self._cv_available = len(self._cv_models) > 0
+        self._metrics_cache: dict[tuple[str, str | bool], pd.DataFrame] = {}
 
     def _model_report(self, model_id: str) -> SingleModelMLClassReport:
         """Returns the SingleModelMLClassReport object for the specified model.
@@ -586,21 +627,9 @@ class MLClassificationReport:
         pd.DataFrame
         """
         if dataset == "train":
-            return pd.concat(
-                [
-                    report.train_report().metrics()
-                    for report in self._id_to_report.values()
-                ],
-                axis=1,
-            )
+            return self._train_stats_all.copy()
         elif dataset == "test":
-            return pd.concat(
-                [
-                    report.test_report().metrics()
-                    for report in self._id_to_report.values()
-                ],
-                axis=1,
-            )
+            return self._test_stats_all.copy()
         else:
             raise ValueError('dataset must be either "train" or "test".')
 
@@ -621,20 +650,21 @@ class MLClassificationReport:
         pd.DataFrame | None
             None is returned if cross validation was not conducted.
         """
-        if not self._models[0].is_cross_validated():
+        if not self._cv_available:
             print_wrapped(
                 "Cross validation statistics are not available "
                 + "for models that are not cross-validated.",
                 type="WARNING",
             )
             return None
-        return pd.concat(
-            [
-                report.train_report().cv_metrics(average_across_folds)
-                for report in self._id_to_report.values()
-            ],
-            axis=1,
-        )
+        if average_across_folds:
+            return self._cv_stats_all.copy()
+        cache_key = ("cv_metrics", average_across_folds)
+        if cache_key not in self._metrics_cache:
+            self._metrics_cache[cache_key] = concat_stats_columns(
+                [model._cv_scorer.cv_stats_df() for model in self._cv_models]
+            )
+        return self._metrics_cache[cache_key].copy()
 
     def fs_report(self) -> VotingSelectionReport | None:
         """Returns the feature selection report. If feature selectors were
@@ -767,6 +797,61 @@ class MLClassificationReport:
         """
         return self._id_to_report[model_id].plot_roc_curve(dataset, figsize, ax)
 
+    def plot_all_roc_curves(
+        self,
+        dataset: Literal["train", "test"] = "test",
+        figsize: tuple[float, float] = (5, 5),
+        n_jobs: int = -1,
+    ) -> dict[str, plt.Figure] | None:
+        """Plots the ROC curve of each model on its own figure. The figures are
+        generated in parallel threads.
+
+        The figures are created directly rather than through pyplot, whose
+        global state is not thread-safe; hence no particular matplotlib backend
+        is required.
+
+        Parameters
+        ----------
+        dataset: Literal['train', 'test']
+            Default: 'test'. The dataset to plot the ROC curves for.
+
+        figsize: tuple[float, float]
+            Default: (5, 5). The size of each figure.
+
+        n_jobs: int
+            Default: -1. Number of threads. If -1, the ThreadPoolExecutor
+            default is used.
+
+        Returns
+        -------
+        dict[str, plt.Figure] | None
+            Figures keyed by model id. None is returned if the models are
+            not binary.
+        """
+        if dataset not in ["train", "test"]:
+            raise ValueError('dataset must be either "train" or "test".')
+        if not self._models[0].is_binary():
+            print_wrapped(
+                "ROC curve is not available for multiclass classification.",
+                type="WARNING",
+            )
+            return None
+
+        def plot(model_id: str) -> plt.Figure:
+            fig = Figure(figsize=figsize)
+            ax = fig.add_subplot(1, 1, 1)
+            if dataset == "train":
+                self._id_to_report[model_id].train_report().plot_roc_curve(ax=ax)
+            else:
+                self._id_to_report[model_id].test_report().plot_roc_curve(ax=ax)
+            fig.tight_layout()
+            return fig
+
+        model_ids = list(self._id_to_report)
+        with ThreadPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs) as ex:
+            figs = list(ex.map(plot, model_ids))
+        return dict(zip(model_ids, figs))
+
     def metrics_by_class(
         self, dataset: Literal["train", "test"]
     ) -> pd.DataFrame | None:
@@ -790,24 +875,27 @@ class MLClassificationReport:
                 type="WARNING",
             )
             return
+        cache_key = ("metrics_by_class", dataset)
+        if cache_key in self._metrics_cache:
+            return self._metrics_cache[cache_key].copy()
         if dataset == "train":
-            return pd.concat(
+            output = concat_stats_columns(
                 [
                     report.train_report().metrics_by_class()
                     for report in self._id_to_report.values()
-                ],
-                axis=1,
+                ]
             )
         elif dataset == "test":
-            return pd.concat(
+            output = concat_stats_columns(
                 [
                     report.test_report().metrics_by_class()
                     for report in self._id_to_report.values()
-                ],
-                axis=1,
+                ]
             )
         else:
             raise ValueError('dataset must be either "train" or "test".')
+        self._metrics_cache[cache_key] = output
+        return output.copy()
 
     def cv_metrics_by_class(
         self,
@@ -827,7 +915,7 @@ class MLClassificationReport:
         pd.DataFrame | None
             None is returned if cross validation was not conducted.
         """
-        if not self._models[0].is_cross_validated():
+        if not self._cv_available:
             print_wrapped(
                 "Cross validation statistics are not available "
                 + "for models that are not cross-validated.",
@@ -841,13 +929,19 @@ class MLClassificationReport:
                 type="WARNING",
             )
             return None
-        return pd.concat(
-            [
-                report.train_report().cv_metrics_by_class(averaged_across_folds)
-                for report in self._id_to_report.values()
-            ],
-            axis=1,
-        )
+        cache_key = ("cv_metrics_by_class", averaged_across_folds)
+        if cache_key not in self._metrics_cache:
+            if averaged_across_folds:
+                by_class_dfs = [
+                    model._cv_scorer.stats_by_class_df() for model in self._cv_models
+                ]
+            else:
+                by_class_dfs = [
+                    model._cv_scorer.cv_stats_by_class_df()
+                    for model in self._cv_models
+                ]
+            self._metrics_cache[cache_key] = concat_stats_columns(by_class_dfs)
+        return self._metrics_cache[cache_key].copy()
 
     def feature_importance(self, model_id: str) -> pd.DataFrame | None:
         """Returns the feature importances of the model with the specified id.
@@ -879,8 +973,33 @@ class MLClassificationReport:
             return True
         return False
 
-    def __getitem__(self, model_id: str) -> SingleModelMLClassReport:
-        return self._id_to_report[model_id]
+    def __getitem__(
+        self, index: str | int | slice | list | np.ndarray
+    ) -> SingleModelMLClassReport | list[SingleModelMLClassReport]:
+        """Indexes into the model reports, in the order the models were given.
+
+        Parameters
+        ----------
+        index : str | int | slice | list | np.ndarray
+            A model id or position returns a single report. A slice, or a
+            sequence of model ids and/or positions, returns a list of reports.
+
+        Returns
+        -------
+        SingleModelMLClassReport | list[SingleModelMLClassReport]
+        """
+        if isinstance(index, str):
+            return self._id_to_report[index]
+        if isinstance(index, (int, np.integer)):
+            return self._reports[index]
+        if isinstance(index, slice):
+            return self._reports[index]
+        if isinstance(index, (list, tuple, np.ndarray)):
+            return [self[i] for i in index]
+        raise ValueError(
+            f"Invalid input: {index}. Index must be a model id, an integer, "
+            "a slice, or a sequence of these."
+        )
 
     def __str__(self) -> str:
         max_width = print_options._max_line_width
@@ -1,4 +1,11 @@
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from joblib.parallel import get_active_backend
 from sklearn.base import BaseEstimator, TransformerMixin, RegressorMixin
+from threadpoolctl import threadpool_limits
+from .base_model import BasePredictModel
+from ...data import DataEmitter
 
 
 class ColumnSelector(BaseEstimator, TransformerMixin):
@@ -29,3 +36,166 @@ class InverseTransformRegressor(BaseEstimator, RegressorMixin):
 
     def score(self, X, y):
         return self.model.score(X, y)
+
+
+def fit_model(
+    model: BasePredictModel,
+    dataemitter: DataEmitter,
+    dataemitters: list[DataEmitter] | None = None,
+    verbose: bool = False,
+    max_threads: int | None = None,
+) -> BasePredictModel:
+    """Specifies the data for a model and fits it. Defined at the module level
+    so that it can be dispatched to joblib workers.
+
+    Parameters
+    ----------
+    model : BasePredictModel
+        The model to fit.
+
+    dataemitter : DataEmitter
+        The DataEmitter for the train/test split.
+
+    dataemitters : list[DataEmitter] | None
+        Default: None. The DataEmitters for nested cross validation.
+
+    verbose : bool
+        Default: False. If True, prints progress.
+
+    max_threads : int | None
+        Default: None. If not None, limits the number of threads used by
+        native thread pools (BLAS, OpenMP) while fitting. Used to avoid
+        oversubscription when several models are fit in parallel.
+
+    Returns
+    -------
+    BasePredictModel
+        The fitted model.
+    """
+    model.specify_data(dataemitter=dataemitter, dataemitters=dataemitters)
+    with threadpool_limits(limits=max_threads):
+        model.fit(verbose=verbose)
+    return model
+
+
+def fit_models(
+    models: list[BasePredictModel],
+    dataemitter: DataEmitter,
+    dataemitters: list[DataEmitter] | None,
+    n_jobs: int,
+) -> list[BasePredictModel]:
+    """Fits the models in parallel with joblib. Processes are preferred, but
+    a thread backend selected with joblib.parallel_config is respected, in
+    which case the models share the data rather than receive pickled copies.
+
+    Each model is fit with one native (BLAS, OpenMP) thread to avoid
+    oversubscription. Process workers each apply their own limit. Threads
+    share the process-wide limits, so a single limit is applied around the
+    whole call instead; per-thread limits would restore each other's saved
+    values out of order and leave the limit in place afterwards.
+
+    Parameters
+    ----------
+    models : list[BasePredictModel]
+        The models to fit.
+
+    dataemitter : DataEmitter
+        The DataEmitter for the train/test split.
+
+    dataemitters : list[DataEmitter] | None
+        The DataEmitters for nested cross validation.
+
+    n_jobs : int
+        Number of models to fit in parallel.
+
+    Returns
+    -------
+    list[BasePredictModel]
+        The fitted models, in the order given. With a process backend these
+        are copies of the provided model objects.
+    """
+    backend, _ = get_active_backend(prefer="processes")
+    if getattr(backend, "uses_threads", False):
+        with threadpool_limits(limits=1):
+            return Parallel(n_jobs=n_jobs, prefer="processes")(
+                delayed(fit_model)(model, dataemitter, dataemitters, verbose=False)
+                for model in models
+            )
+    return Parallel(n_jobs=n_jobs, prefer="processes")(
+        delayed(fit_model)(
+            model, dataemitter, dataemitters, verbose=False, max_threads=1
+        )
+        for model in models
+    )
+
+
+def concat_stats_columns(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenates per-model statistics DataFrames column-wise. When all
+    DataFrames share the same index, as the statistics of models scored on the
+    same data do, the values are stacked directly instead of aligned by index.
+
+    Parameters
+    ----------
+    dfs : list[pd.DataFrame]
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    index = dfs[0].index
+    if not all(df.index.equals(index) for df in dfs[1:]):
+        return pd.concat(dfs, axis=1)
+    return pd.DataFrame(
+        np.concatenate([df.to_numpy() for df in dfs], axis=1),
+        index=index,
+        columns=dfs[0].columns.append([df.columns for df in dfs[1:]]),
+    )
+
+
+def summarize_fitted_models(
+    models: list[BasePredictModel],
+) -> tuple[pd.DataFrame, pd.DataFrame, list[BasePredictModel], pd.DataFrame | None]:
+    """Finishes the fitting stage of an ML report. Releases the data memoized
+    by the models' DataEmitters, which is only needed while fitting, so that
+    the fitted models do not keep the train and test data alive. Then gathers
+    the statistics of all models, one column per model, since the aggregated
+    metrics are pure functions of the fitted models.
+
+    Parameters
+    ----------
+    models : list[BasePredictModel]
+        The fitted models.
+
+    Returns
+    -------
+    pd.DataFrame
+        Train statistics of all models.
+
+    pd.DataFrame
+        Test statistics of all models.
+
+    list[BasePredictModel]
+        The cross-validated models.
+
+    pd.DataFrame | None
+        Cross validation statistics, averaged across folds, of the
+        cross-validated models. None if no model is cross-validated.
+    """
+    for model in models:
+        model._dataemitter._clear_emission_cache()
+        for emitter in model._dataemitters or []:
+            emitter._clear_emission_cache()
+
+    train_stats = concat_stats_columns(
+        [model._train_scorer.stats_df() for model in models]
+    )
+    test_stats = concat_stats_columns(
+        [model._test_scorer.stats_df() for model in models]
+    )
+    cv_models = [model for model in models if model.is_cross_validated()]
+    cv_stats = None
+    if len(cv_models) > 0:
+        cv_stats = concat_stats_columns(
+            [model._cv_scorer.stats_df() for model in cv_models]
+        )
+    return train_stats, test_stats, cv_models, cv_stats
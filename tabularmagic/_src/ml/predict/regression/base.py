@@ -120,7 +120,7 @@ class BaseR(BasePredictModel):
             y_pred = self._best_estimator.predict(X_train)
             if y_scaler is not None:
                 y_pred = y_scaler.inverse_transform(y_pred)
-                y_train = y_scaler.inverse_transform(y_train)
+            y_train = self._dataemitter._emit_train_y_unscaled()
             self._train_scorer = RegressionScorer(
                 y_pred=y_pred,
                 y_true=y_train,
@@ -197,7 +197,7 @@ class BaseR(BasePredictModel):
             y_pred = self._best_estimator.predict(X_train)
             if y_scaler is not None:
                 y_pred = y_scaler.inverse_transform(y_pred)
-                y_train = y_scaler.inverse_transform(y_train)
+            y_train = self._dataemitter._emit_train_y_unscaled()
 
             self._train_scorer = RegressionScorer(
                 y_pred=y_pred,
@@ -209,19 +209,18 @@ class BaseR(BasePredictModel):
         else:
             raise ValueError("DataEmitter or DataEmitters not specified.")
 
-        X_test_df, y_test_series = self._dataemitter.emit_test_Xy()
+        X_test_df, _ = self._dataemitter.emit_test_Xy()
 
         if self._feature_selectors is None:
             X_test = X_test_df
         else:
             X_test = self._feature_selection_report._emit_test_X()
 
-        y_test = y_test_series.to_numpy()
+        y_test = self._dataemitter._emit_test_y_unscaled()
 
         y_pred = self._best_estimator.predict(X_test)
         if y_scaler is not None:
             y_pred = y_scaler.inverse_transform(y_pred)
-            y_test = y_scaler.inverse_transform(y_test)
 
         self._test_scorer = RegressionScorer(
             y_pred=y_pred, y_true=y_test, n_predictors=X_test.shape[1], name=str(self)
@@ -62,7 +62,7 @@ class CustomR(BaseR):
             y_pred = self._best_estimator.predict(X_train)
             if y_scaler is not None:
                 y_pred = y_scaler.inverse_transform(y_pred)
-                y_train = y_scaler.inverse_transform(y_train)
+            y_train = self._dataemitter._emit_train_y_unscaled()
             self._train_scorer = RegressionScorer(
                 y_pred=y_pred,
                 y_true=y_train,
@@ -116,7 +116,7 @@ class CustomR(BaseR):
             y_pred = self._best_estimator.predict(X_train)
             if y_scaler is not None:
                 y_pred = y_scaler.inverse_transform(y_pred)
-                y_train = y_scaler.inverse_transform(y_train)
+            y_train = self._dataemitter._emit_train_y_unscaled()
 
             self._train_scorer = RegressionScorer(
                 y_pred=y_pred,
@@ -128,14 +128,13 @@ class CustomR(BaseR):
         else:
             raise ValueError("The datahandler must not be None")
 
-        X_test_df, y_test_series = self._dataemitter.emit_test_Xy()
+        X_test_df, _ = self._dataemitter.emit_test_Xy()
         X_test = X_test_df
-        y_test = y_test_series.to_numpy()
+        y_test = self._dataemitter._emit_test_y_unscaled()
 
         y_pred = self._best_estimator.predict(X_test)
         if y_scaler is not None:
             y_pred = y_scaler.inverse_transform(y_pred)
-            y_test = y_scaler.inverse_transform(y_test)
 
         self._test_scorer = RegressionScorer(
             y_pred=y_pred, y_true=y_test, n_predictors=X_test.shape[1], name=str(self)
@@ -3,6 +3,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 from typing import Literal
 import warnings
+from ..predict_utils import (
+    fit_model,
+    fit_models,
+    concat_stats_columns,
+    summarize_fitted_models,
+)
 from .base import BaseR
 from ....data.datahandler import DataHandler
 from ....metrics.visualization import plot_obs_vs_pred
@@ -44,6 +50,13 @@ class SingleModelSingleDatasetMLRegReport:
         if dataset not in ["train", "test"]:
             raise ValueError('dataset must be either "train" or "test".')
         self._dataset = dataset
+        self._plot_limits = None
+        # the scorer already computed the correlation shown in the plot title
+        if dataset == "train":
+            scorer = model._train_scorer
+        else:
+            scorer = model._test_scorer
+        self._pearsonr = float(scorer.stats_df().loc["pearsonr"].iloc[0])
 
     def metrics(self) -> pd.DataFrame:
         """Returns a DataFrame containing the goodness-of-fit statistics
@@ -119,7 +132,22 @@ class SingleModelSingleDatasetMLRegReport:
         else:
             y_pred = self._model._test_scorer._y_pred
             y_true = self._model._test_scorer._y_true
-        return plot_obs_vs_pred(y_pred, y_true, self._model._name, figsize, ax)
+        # the predictions are fixed once the model is fit, so the axis limits
+        # are computed on the first plot only
+        if self._plot_limits is None:
+            self._plot_limits = (
+                min(np.min(y_pred), np.min(y_true)),
+                max(np.max(y_pred), np.max(y_true)),
+            )
+        return plot_obs_vs_pred(
+            y_pred,
+            y_true,
+            self._model._name,
+            figsize,
+            ax,
+            self._plot_limits,
+            self._pearsonr,
+        )
 
 
 class SingleModelMLRegReport:
@@ -138,6 +166,8 @@ class SingleModelMLRegReport:
             The model should already be trained on the specified data.
         """
         self._model = model
+        self._train_report = SingleModelSingleDatasetMLRegReport(model, "train")
+        self._test_report = SingleModelSingleDatasetMLRegReport(model, "test")
 
     def train_report(self) -> SingleModelSingleDatasetMLRegReport:
         """Returns a SingleModelSingleDatasetMLReport object for the training data.
@@ -146,7 +176,7 @@ class SingleModelMLRegReport:
         -------
         SingleModelSingleDatasetMLReport
         """
-        return SingleModelSingleDatasetMLRegReport(self._model, "train")
+        return self._train_report
 
     def test_report(self) -> SingleModelSingleDatasetMLRegReport:
         """Returns a SingleModelSingleDatasetMLReport object for the test data.
@@ -155,7 +185,7 @@ class SingleModelMLRegReport:
         -------
         SingleModelSingleDatasetMLReport
         """
-        return SingleModelSingleDatasetMLRegReport(self._model, "test")
+        return self._test_report
 
     def model(self) -> BaseR:
         """Returns the model.
@@ -240,6 +270,7 @@ class MLRegressionReport:
         outer_cv: int | None = None,
         outer_cv_seed: int = 42,
         verbose: bool = True,
+        n_jobs: int = 1,
     ):
         """MLRegressionReport.
         Fits the model based on provided DataHandler.
@@ -277,18 +308,24 @@ class MLRegressionReport:
 
         verbose : bool
             Default: True. If True, prints progress.
+
+        n_jobs : int
+            Default: 1. Number of models to fit in parallel. If not 1, the
+            models are fit in separate processes, and the fitted models
+            replace the provided model objects. To fit the models in threads
+            that share the data instead, wrap the call in
+            joblib.parallel_config(backend="threading"). Either way, each
+            model is fit with a single BLAS/OpenMP thread.
         """
-        self._models: list[BaseR] = models
+        self._models: list[BaseR] = list(models)
 
+        self._id_to_model = {}
         for model in self._models:
             if not isinstance(model, BaseR):
                 raise ValueError(
                     f"Model {quote_and_color(model._name)} is not an instance "
                     "of BaseR. All models must be instances of BaseR."
                 )
-
-        self._id_to_model = {}
-        for model in models:
             if model._name in self._id_to_model:
                 raise ValueError(
                     f"Duplicate model name: {quote_and_color(model._name)}."
@@ -343,18 +380,26 @@ class MLRegressionReport:
 
         self._verbose = verbose
 
-        for model in self._models:
+        if n_jobs != 1:
             if self._verbose:
                 print_wrapped(
-                    f"Evaluating model {quote_and_color(model._name)}.",
+                    f"Evaluating {len(self._models)} models in parallel.",
                     type="UPDATE",
                 )
-            model.specify_data(
-                dataemitter=self._emitter,
-                dataemitters=self._emitters,
+            self._models = fit_models(
+                self._models, self._emitter, self._emitters, n_jobs
             )
 
-            model.fit(verbose=self._verbose)
+        self._id_to_report = {}
+        self._reports: list[SingleModelMLRegReport] = []
+        for model in self._models:
+            if n_jobs == 1:
+                if self._verbose:
+                    print_wrapped(
+                        f"Evaluating model {quote_and_color(model._name)}.",
+                        type="UPDATE",
+                    )
+                fit_model(model, self._emitter, self._emitters, self._verbose)
 
             if (
                 model._feature_selection_report is not None
@@ -387,9 +432,21 @@ class MLRegressionReport:
                     type="UPDATE",
                 )
 
-        self._id_to_report = {
-            model._name: SingleModelMLRegReport(model) for model in models
-        }
+            # parallel fitting returns new model objects; both lookups are
+            # (re)filled here in the same pass
+            self._id_to_model[model._name] = model
+            report = SingleModelMLRegReport(model)
+            self._id_to_report[model._name] = report
+            self._reports.append(report)
+
+        (
+            self._train_stats_all,
+            self._test_stats_all,
+            self._cv_models,
+            self._cv_stats_all,
+        ) = summarize_fitted_models(self._models)
+        self._cv_available = len(self._cv_models) > 0
+        self._metrics_cache: dict[tuple[str, str | bool], pd.DataFrame] = {}
 
     def _model_report(self, model_id: str) -> SingleModelMLRegReport:
         """Returns the SingleModelMLRegReport object for the specified model.
@@ -437,21 +494,9 @@ class MLRegressionReport:
         pd.DataFrame
         """
         if dataset == "train":
-            return pd.concat(
-                [
-                    report.train_report().metrics()
-                    for report in self._id_to_report.values()
-                ],
-                axis=1,
-            )
+            return self._train_stats_all.copy()
         elif dataset == "test":
-            return pd.concat(
-                [
-                    report.test_report().metrics()
-                    for report in self._id_to_report.values()
-                ],
-                axis=1,
-            )
+            return self._test_stats_all.copy()
         else:
             raise ValueError('dataset must be either "train" or "test".')
 
@@ -474,20 +519,21 @@ class MLRegressionReport:
         pd.DataFrame | None
             None if cross validation was not conducted.
         """
-        if not self._models[0].is_cross_validated():
+        if not self._cv_available:
             print_wrapped(
                 "Cross validation statistics are not available "
                 + "for models that are not cross-validated.",
                 type="WARNING",
             )
             return None
-        return pd.concat(
-            [
-                report.train_report().cv_metrics(average_across_folds)
-                for report in self._id_to_report.values()
-            ],
-            axis=1,
-        )
+        if average_across_folds:
+            return self._cv_stats_all.copy()
+        cache_key = ("cv_metrics", average_across_folds)
+        if cache_key not in self._metrics_cache:
+            self._metrics_cache[cache_key] = concat_stats_columns(
+                [model._cv_scorer.cv_stats_df() for model in self._cv_models]
+            )
+        return self._metrics_cache[cache_key].copy()
 
     def fs_report(self) -> VotingSelectionReport | None:
         """Returns the feature selection report. If feature selectors were
@@ -539,6 +585,69 @@ class MLRegressionReport:
         """
         return self._id_to_report[model_id].plot_obs_vs_pred(dataset, figsize, ax)
 
+    def plot_obs_vs_pred_grid(
+        self,
+        dataset: Literal["train", "test"] = "test",
+        ncols: int = 4,
+        figsize: tuple[float, float] | None = None,
+    ) -> plt.Figure:
+        """Returns a single figure with the observed vs predicted scatter plot
+        of every model, one subplot per model. All subplots share the same
+        axis limits, so the models can be compared at a glance.
+
+        Parameters
+        ----------
+        dataset : Literal['train', 'test']
+            Default: 'test'. The dataset for which to plot the observed vs
+            predicted values.
+
+        ncols : int
+            Default: 4. The maximum number of subplots per row.
+
+        figsize : tuple[float, float] | None
+            Default: None. The size of the figure. If None, each subplot is
+            allotted a 4 by 4 area.
+
+        Returns
+        -------
+        plt.Figure
+        """
+        if dataset == "train":
+            scorers = [model._train_scorer for model in self._models]
+        elif dataset == "test":
+            scorers = [model._test_scorer for model in self._models]
+        else:
+            raise ValueError('dataset must be either "train" or "test".')
+        if ncols < 1:
+            raise ValueError("ncols must be a positive integer.")
+
+        ncols = min(ncols, len(scorers))
+        nrows = -(-len(scorers) // ncols)
+        if figsize is None:
+            figsize = (4 * ncols, 4 * nrows)
+
+        limits = (
+            min(min(np.min(s._y_pred), np.min(s._y_true)) for s in scorers),
+            max(max(np.max(s._y_pred), np.max(s._y_true)) for s in scorers),
+        )
+
+        # one figure and one layout pass for all models
+        fig, axs = plt.subplots(nrows, ncols, figsize=figsize, squeeze=False)
+        for ax, model, scorer in zip(axs.flat, self._models, scorers):
+            plot_obs_vs_pred(
+                scorer._y_pred,
+                scorer._y_true,
+                model._name,
+                ax=ax,
+                limits=limits,
+                rho=float(scorer.stats_df().loc["pearsonr"].iloc[0]),
+            )
+        for ax in axs.flat[len(scorers) :]:
+            ax.set_visible(False)
+        fig.tight_layout()
+        plt.close(fig)
+        return fig
+
     def feature_importance(self, model_id: str) -> pd.DataFrame | None:
         """Returns the feature importances of the model with the specified id.
         If the model does not have feature importances, the coefficients are returned
@@ -557,8 +666,33 @@ class MLRegressionReport:
         """
         return self._id_to_report[model_id].feature_importance()
 
-    def __getitem__(self, model_id: str) -> SingleModelMLRegReport:
-        return self._id_to_report[model_id]
+    def __getitem__(
+        self, index: str | int | slice | list | np.ndarray
+    ) -> SingleModelMLRegReport | list[SingleModelMLRegReport]:
+        """Indexes into the model reports, in the order the models were given.
+
+        Parameters
+        ----------
+        index : str | int | slice | list | np.ndarray
+            A model id or position returns a single report. A slice, or a
+            sequence of model ids and/or positions, returns a list of reports.
+
+        Returns
+        -------
+        SingleModelMLRegReport | list[SingleModelMLRegReport]
+        """
+        if isinstance(index, str):
+            return self._id_to_report[index]
+        if isinstance(index, (int, np.integer)):
+            return self._reports[index]
+        if isinstance(index, slice):
+            return self._reports[index]
+        if isinstance(index, (list, tuple, np.ndarray)):
+            return [self[i] for i in index]
+        raise ValueError(
+            f"Invalid input: {index}. Index must be a model id, an integer, "
+            "a slice, or a sequence of these."
+        )
 
     def __str__(self) -> str:
         n_dec = print_options._n_decimals
@@ -55,3 +55,46 @@ def test_dataemitter_sklearn_transformer_basic(setup_data):
 
     assert "SalePrice" not in transformer_df.columns
     assert np.allclose(emitted_df.values, transformer_df.values, atol=1e-5)
+
+
+def test_dataemitter_test_Xy_reused(setup_data):
+    """Test that repeated test emissions agree and respect predictor selection"""
+    train_data = setup_data["df_house_train"]
+    test_data = setup_data["df_house_test"]
+    dh = DataHandler(train_data, test_data, verbose=False)
+
+    de = dh.train_test_emitter(
+        y_var="SalePrice",
+        X_vars=["GrLivArea", "YearBuilt", "OverallQual", "LotShape"],
+    )
+    de.emit_train_Xy()
+
+    X_first, y_first = de.emit_test_Xy()
+    X_first["extra"] = 0.0
+    X_second, y_second = de.emit_test_Xy()
+    assert "extra" not in X_second.columns
+    assert X_second.shape[1] == X_first.shape[1] - 1
+    assert np.array_equal(y_first.to_numpy(), y_second.to_numpy())
+    assert de._emit_train_y_unscaled() is de._emit_train_y_unscaled()
+
+    de.select_predictors(["GrLivArea", "OverallQual"])
+    assert de.emit_test_Xy()[0].columns.to_list() == ["GrLivArea", "OverallQual"]
+
+
+def test_dataemitter_identity_y_scaler():
+    """Test that an identity target scaler is reported as no scaler"""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.normal(size=50), "y": rng.uniform(size=50)})
+    df.loc[0, "y"] = 0.0
+    df.loc[1, "y"] = 1.0
+    dh = DataHandler(df.iloc[:40], df.iloc[40:], verbose=False)
+
+    dh.scale(include_vars=["y"], strategy="minmax")
+    de = dh.train_test_emitter(y_var="y", X_vars=["x"])
+    assert de._yscaler.is_identity
+    assert de.y_scaler() is None
+    assert np.array_equal(de._emit_test_y_unscaled(), df["y"].iloc[40:].to_numpy())
+
+    dh.scale(include_vars=["x"], strategy="minmax")
+    de = dh.train_test_emitter(y_var="x", X_vars=["y"])
+    assert de.y_scaler() is not None
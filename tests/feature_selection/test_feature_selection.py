@@ -1,7 +1,9 @@
 import pathlib
 import sys
+import numpy as np
 import pandas as pd
 import pytest
+from sklearn.datasets import make_regression
 from sklearn.model_selection import train_test_split
 
 parent_dir = pathlib.Path(__file__).resolve().parent.parent.parent
@@ -122,3 +124,139 @@ def test_fs_simple(setup_data):
     assert len(report.model("simple_tester_2").predictors()) == 3
     assert report.model("simple_tester")._best_estimator.n_features_in_ == 2
     assert report.model("simple_tester_2")._best_estimator.n_features_in_ == 3
+
+
+def test_lasso_fista_matches_cd():
+    """Tests that the FISTA Lasso solver agrees with coordinate descent"""
+    X, y = make_regression(
+        n_samples=200, n_features=10, n_informative=3, noise=1.0, random_state=42
+    )
+    df = pd.DataFrame(X, columns=[f"x{i}" for i in range(10)])
+    df["y"] = y
+    analyzer = tm.Analyzer(df, test_size=0.2, verbose=False)
+
+    selectors = [
+        tm.fs.LassoFSR(3, alpha=1.0, name="cd"),
+        tm.fs.LassoFSR(3, alpha=1.0, name="fista", solver="fista"),
+    ]
+    report = analyzer.regress(
+        models=[tm.ml.LinearR(type="ols")],
+        target="y",
+        feature_selectors=selectors,
+    )
+    assert report.fs_report() is not None
+    assert set(selectors[0].selected_features()) == set(
+        selectors[1].selected_features()
+    )
+    assert np.allclose(
+        selectors[0]._all_feature_scores,
+        selectors[1]._all_feature_scores,
+        atol=1e-2,
+    )
+
+    with pytest.raises(ValueError):
+        tm.fs.LassoFSR(3, solver="fista")
+
+
+def test_lasso_numba_cd_matches_sklearn():
+    """Tests that the numba coordinate descent Lasso agrees with sklearn"""
+    pytest.importorskip("numba")
+    from sklearn.linear_model import Lasso
+    from tabularmagic._src.feature_selection.regression_feature_selection import (
+        _lasso_cd,
+    )
+
+    X, y = make_regression(
+        n_samples=200, n_features=30, n_informative=5, noise=5.0, random_state=42
+    )
+    # a near-collinear pair, whose coefficients depend on the stopping rule
+    X[:, 1] = X[:, 0] + 0.05 * np.random.default_rng(42).normal(size=200)
+    for alpha in [0.01, 0.1, 1.0, 10.0]:
+        coef, intercept = _lasso_cd(np.asfortranarray(X), y, alpha)
+        lasso = Lasso(alpha=alpha).fit(X, y)
+        assert np.array_equal(coef != 0, lasso.coef_ != 0)
+        assert np.allclose(coef, lasso.coef_, rtol=0, atol=1e-8)
+        assert np.isclose(intercept, lasso.intercept_, rtol=0, atol=1e-8)
+
+    # strongly correlated predictors converge slowly; small coefficient
+    # updates alone do not mean that the solution is reached
+    rng = np.random.default_rng(10)
+    X = rng.normal(size=(60, 1)) + 0.005 * rng.normal(size=(60, 40))
+    X[:, 20:] = rng.normal(size=(60, 20))
+    y = 10 * X[:, 0] + X[:, 20] + 0.5 * rng.normal(size=60)
+    coef, _ = _lasso_cd(np.asfortranarray(X), y, 1e-2)
+    lasso = Lasso(alpha=1e-2).fit(X, y)
+    assert np.array_equal(coef != 0, lasso.coef_ != 0)
+    assert np.allclose(coef, lasso.coef_, rtol=0, atol=1e-8)
+
+
+def test_lasso_single_predictor():
+    """Tests LassoFSR with a single predictor"""
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({"x": rng.normal(size=100)})
+    df["y"] = 2 * df["x"] + rng.normal(size=100)
+    analyzer = tm.Analyzer(df, test_size=0.2, verbose=False)
+
+    selectors = [
+        tm.fs.LassoFSR(1, alpha=0.1, name="cd"),
+        tm.fs.LassoFSR(1, alpha=0.1, name="cd32", single_precision=True),
+    ]
+    report = analyzer.regress(
+        models=[tm.ml.LinearR(type="ols")],
+        target="y",
+        predictors=["x"],
+        feature_selectors=selectors,
+    )
+    assert report.fs_report() is not None
+    for selector in selectors:
+        assert list(selector.selected_features()) == ["x"]
+
+
+def test_f_regression_matches_sklearn():
+    """Tests that the F-statistic and correlation scores and the KBestFSR
+    supports agree with sklearn, including near-collinear features"""
+    from sklearn.feature_selection import SelectKBest, f_regression, r_regression
+    from tabularmagic._src.feature_selection.regression_feature_selection import (
+        _f_regression_fast,
+    )
+
+    rng = np.random.default_rng(42)
+    X, y = make_regression(
+        n_samples=200, n_features=6, n_informative=3, noise=1.0, random_state=42
+    )
+    y = X[:, 0] + 1e-3 * rng.normal(size=200)
+    X[:, 1] = y + 3e-3 * rng.normal(size=200)
+    X[:, 2] = 1.0
+    df = pd.DataFrame(X, columns=[f"x{i}" for i in range(6)])
+    df["y"] = y
+
+    assert np.allclose(_f_regression_fast(X, y), f_regression(X, y)[0])
+    assert np.allclose(_f_regression_fast(X, y, return_r=True), r_regression(X, y))
+
+    emitter = tm.Analyzer(df, test_size=0.2, verbose=False)._datahandler
+    emitter = emitter.train_test_emitter(y_var="y", X_vars=list(df.columns[:-1]))
+    X_train, y_train = emitter.emit_train_Xy()
+    for scorer, score_func in [
+        ("f_regression", f_regression),
+        ("r_regression", r_regression),
+    ]:
+        for k in [1, 2, 4]:
+            _, _, support = tm.fs.KBestFSR(scorer, k).select(emitter)
+            expected = SelectKBest(score_func, k=k).fit(X_train, y_train)
+            assert np.array_equal(support, expected.get_support())
+
+
+def test_mutual_info_matches_sklearn():
+    """Tests that the shared KD-tree mutual information agrees with sklearn"""
+    from sklearn.feature_selection import mutual_info_regression
+    from tabularmagic._src.feature_selection.regression_feature_selection import (
+        _mutual_info_regression_fast,
+    )
+
+    X, y = make_regression(
+        n_samples=300, n_features=8, n_informative=3, noise=1.0, random_state=42
+    )
+    assert np.allclose(
+        _mutual_info_regression_fast(X, y),
+        mutual_info_regression(X, y, random_state=42),
+    )
@@ -1,9 +1,12 @@
 import pathlib
 import sys
+import joblib
 import pandas as pd
 import pytest
 import numpy as np
 from sklearn.datasets import make_regression, make_classification
+from scipy.stats import pearsonr
+from threadpoolctl import threadpool_info, threadpool_limits
 from sklearn.linear_model import Ridge, LogisticRegression
 
 
@@ -151,3 +154,144 @@ def test_classification_run_simple(setup_data):
         feature_selectors=[tm.fs.KBestFSC("f_classif", 2)],
     )
     assert len(report.model("LinearC(l2)")._test_scorer._y_pred) == SAMPLE_SIZE * 0.4
+
+
+def test_regression_metrics_cached(setup_data):
+    """Tests that repeated metrics queries are consistent and independent"""
+    analyzer = tm.Analyzer(setup_data["df_house_mini"], test_size=0.4, verbose=False)
+    report = analyzer.regress(
+        models=[
+            tm.ml.LinearR(
+                type="l2",
+                n_trials=1,
+            ),
+            tm.ml.CustomR(estimator=Ridge()),
+        ],
+        target="SalePrice",
+        predictors=[
+            "MSZoning",
+            "ExterQual_binary",
+            "LotArea",
+            "OverallQual",
+        ],
+        outer_cv=2,
+    )
+    first = report.metrics("test")
+    first.loc["rmse"] = -1.0
+    second = report.metrics("test")
+    assert (second.loc["rmse"] > 0).all()
+    assert list(second.columns) == ["LinearR(l2)", "Ridge()"]
+    assert report.cv_metrics().equals(report.cv_metrics())
+    assert report.cv_metrics(False).shape[1] == 2
+    assert report[1] is report["Ridge()"]
+    assert report[:] == [report["LinearR(l2)"], report["Ridge()"]]
+    assert report[np.array([1, 0])] == [report["Ridge()"], report[0]]
+
+    fig = report.plot_obs_vs_pred_grid("test", ncols=3)
+    axes = [ax for ax in fig.axes if ax.get_visible()]
+    assert len(fig.axes) == 2 and len(axes) == 2
+    assert axes[0].get_xlim() == axes[1].get_ylim()
+    scorer = report.model("Ridge()")._test_scorer
+    rho = round(pearsonr(scorer._y_pred, scorer._y_true)[0], 3)
+    assert axes[1].get_title().endswith(f"ρ = {rho}")
+
+    # emitted data is released once the report has been built
+    emitter = report.model("Ridge()")._dataemitter
+    assert emitter._train_Xy_cache is None and emitter._test_Xy_cache is None
+
+
+def test_regression_run_parallel(setup_data):
+    """Tests that parallel model fitting matches serial model fitting"""
+    analyzer = tm.Analyzer(setup_data["df_house_mini"], test_size=0.4, verbose=False)
+    kwargs = dict(
+        target="SalePrice",
+        predictors=[
+            "MSZoning",
+            "ExterQual_binary",
+            "LotArea",
+            "OverallQual",
+        ],
+        outer_cv=2,
+    )
+    serial_report = analyzer.regress(
+        models=[
+            tm.ml.LinearR(type="ols"),
+            tm.ml.CustomR(estimator=Ridge()),
+        ],
+        **kwargs,
+    )
+    parallel_report = analyzer.regress(
+        models=[
+            tm.ml.LinearR(type="ols"),
+            tm.ml.CustomR(estimator=Ridge()),
+        ],
+        n_jobs=2,
+        **kwargs,
+    )
+    assert np.allclose(
+        serial_report.metrics("test").to_numpy(dtype=float),
+        parallel_report.metrics("test").to_numpy(dtype=float),
+    )
+    assert parallel_report.model("LinearR(ols)").is_cross_validated()
+
+    with joblib.parallel_config(backend="threading"):
+        threaded_report = analyzer.regress(
+            models=[
+                tm.ml.LinearR(type="ols"),
+                tm.ml.CustomR(estimator=Ridge()),
+            ],
+            n_jobs=2,
+            **kwargs,
+        )
+    assert np.allclose(
+        serial_report.cv_metrics().to_numpy(dtype=float),
+        threaded_report.cv_metrics().to_numpy(dtype=float),
+    )
+
+
+def test_regression_run_threaded_restores_thread_limits():
+    """Tests that fitting models in threads leaves the native thread limits
+    as they were"""
+    X, y = make_regression(n_samples=200, n_features=5, random_state=42)
+    df = pd.DataFrame(X, columns=[f"x{i}" for i in range(5)])
+    df["y"] = y
+    analyzer = tm.Analyzer(df, test_size=0.3, verbose=False)
+
+    with threadpool_limits(limits=2):
+        n_threads = [info["num_threads"] for info in threadpool_info()]
+        with joblib.parallel_config(backend="threading"):
+            analyzer.regress(
+                models=[
+                    tm.ml.CustomR(estimator=Ridge(alpha=alpha), name=f"ridge{alpha}")
+                    for alpha in range(1, 13)
+                ],
+                target="y",
+                outer_cv=3,
+                n_jobs=6,
+            )
+        assert [info["num_threads"] for info in threadpool_info()] == n_threads
+
+
+def test_classification_roc_curves(setup_data):
+    """Tests ROC curve plotting for binary classification reports"""
+    analyzer = tm.Analyzer(setup_data["df_house_mini"], test_size=0.4, verbose=False)
+    report = analyzer.classify(
+        models=[
+            tm.ml.LinearC(
+                type="l2",
+                n_trials=1,
+            ),
+            tm.ml.CustomC(estimator=LogisticRegression()),
+        ],
+        target="ExterQual_binary",
+        predictors=[
+            "MSZoning",
+            "SalePrice",
+            "LotArea",
+            "OverallQual",
+        ],
+    )
+    assert report.plot_roc_curves("test") is not None
+    figs = report.plot_all_roc_curves("test", n_jobs=2)
+    assert list(figs.keys()) == ["LinearC(l2)", "LogisticRegression()"]
+    assert all(len(fig.axes) == 1 for fig in figs.values())